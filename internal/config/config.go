@@ -27,6 +27,11 @@ type Config struct {
 	Council      Council      `yaml:"council"`
 	Tools        []Tool       `yaml:"tools"`
 	Embedder     Embedder     `yaml:"embedder"`
+
+	// providerNames is the compiled name set for KnownProvider, built once in
+	// ApplyDefaults — override validation runs per task submission and must
+	// not rebuild it each time.
+	providerNames map[string]bool
 }
 
 // Defaults are global fallbacks (spec 07 §2).
@@ -226,6 +231,25 @@ func (c *Config) ApplyDefaults() {
 			c.Providers[i].Vendor = "anthropic"
 		}
 	}
+	c.providerNames = make(map[string]bool, len(c.Providers))
+	for _, p := range c.Providers {
+		c.providerNames[p.Name] = true
+	}
+}
+
+// KnownProvider reports whether a provider with the given name is declared.
+// Configs that skipped ApplyDefaults (hand-built in tests) fall back to a
+// linear scan rather than mutating shared state from a read path.
+func (c *Config) KnownProvider(name string) bool {
+	if c.providerNames != nil {
+		return c.providerNames[name]
+	}
+	for _, p := range c.Providers {
+		if p.Name == name {
+			return true
+		}
+	}
+	return false
 }
 
 // BudgetDefaultUSD resolves the effective global per-task ceiling.
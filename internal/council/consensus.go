@@ -3,13 +3,11 @@ package council
 import (
 	"context"
 	"encoding/json"
-
 	"fmt"
-	"github.com/stukennedy/kyotee/internal/budget"
 	"math"
-	"sort"
 	"strings"
 
+	"github.com/stukennedy/kyotee/internal/budget"
 	"github.com/stukennedy/kyotee/internal/events"
 	"github.com/stukennedy/kyotee/internal/jsonx"
 	"github.com/stukennedy/kyotee/internal/pipeline"
@@ -219,23 +217,21 @@ func (c *Stage) majorityChoice(members []*member) string {
 		t.count++
 		t.conf += m.vote.Confidence
 	}
-	keys := make([]string, 0, len(tallies))
-	for k := range tallies {
-		keys = append(keys, k)
-	}
-	sort.Slice(keys, func(i, j int) bool {
-		a, b := tallies[keys[i]], tallies[keys[j]]
-		if a.count != b.count {
-			return a.count > b.count
+	// Only the winner matters: single-pass argmax instead of sorting every
+	// tally. Same ordering — count, then aggregate confidence, then key.
+	var w *tally
+	wKey := ""
+	for k, t := range tallies {
+		switch {
+		case w == nil,
+			t.count > w.count,
+			t.count == w.count && t.conf > w.conf,
+			t.count == w.count && t.conf == w.conf && k < wKey:
+			w, wKey = t, k
 		}
-		if a.conf != b.conf {
-			return a.conf > b.conf
-		}
-		return keys[i] < keys[j]
-	})
-	if len(keys) == 0 {
+	}
+	if w == nil {
 		return ""
 	}
-	w := tallies[keys[0]]
 	return fmt.Sprintf("%s (plurality: %d votes, aggregate confidence %.2f)", w.label, w.count, w.conf)
 }
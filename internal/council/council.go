@@ -95,7 +95,10 @@ func (c *Stage) Run(ctx context.Context, st *pipeline.State, emit events.Emitter
 		members[i] = &member{p: p}
 	}
 
-	// Opening turns run in parallel — independent, no shared context, no anchoring.
+	// Opening turns run in parallel — independent, no shared context, no
+	// anchoring. The prompt is identical for every member: build it once,
+	// not once per goroutine.
+	opening := c.openingPrompt(st, method)
 	var mu sync.Mutex
 	var wg sync.WaitGroup
 	openErrs := make([]error, len(members))
@@ -103,7 +106,7 @@ func (c *Stage) Run(ctx context.Context, st *pipeline.State, emit events.Emitter
 		wg.Add(1)
 		go func(i int, m *member) {
 			defer wg.Done()
-			text, usage, err := c.memberCall(ctx, m.p, st, c.openingPrompt(st, method), emit)
+			text, usage, err := c.memberCall(ctx, m.p, st, opening, emit)
 			mu.Lock()
 			defer mu.Unlock()
 			if err != nil {
@@ -162,13 +165,15 @@ func (c *Stage) Run(ctx context.Context, st *pipeline.State, emit events.Emitter
 		}
 
 		roundsUsed = r
-		snapshot := c.positionSnapshot(members)
+		// The joined snapshot is the same for every member this round; only
+		// the member's own prior position varies per prompt.
+		others := strings.Join(c.positionSnapshot(members), "\n\n---\n\n")
 		var rwg sync.WaitGroup
 		for _, m := range members {
 			rwg.Add(1)
 			go func(m *member) {
 				defer rwg.Done()
-				text, usage, err := c.memberCall(ctx, m.p, st, c.rebuttalPrompt(st, m, snapshot, r, method), emit)
+				text, usage, err := c.memberCall(ctx, m.p, st, c.rebuttalPrompt(st, m, others, r, method), emit)
 				mu.Lock()
 				defer mu.Unlock()
 				if err != nil {
@@ -244,7 +249,7 @@ func (c *Stage) openingPrompt(st *pipeline.State, method string) string {
 	return p
 }
 
-func (c *Stage) rebuttalPrompt(st *pipeline.State, m *member, others []string, round int, method string) string {
+func (c *Stage) rebuttalPrompt(st *pipeline.State, m *member, others string, round int, method string) string {
 	p := fmt.Sprintf(`Task:
 %s
 
@@ -255,7 +260,7 @@ The other council members' latest positions (distilled):
 %s
 
 Rebut or revise. If another member's argument is stronger, adopt it and say so. State clearly whether you now agree with the group.`,
-		st.PromptBody(), round, distill(m.position, 1200), strings.Join(others, "\n\n---\n\n"))
+		st.PromptBody(), round, distill(m.position, 1200), others)
 	if method == "vote" {
 		p += voteInstruction
 	}
@@ -8,26 +8,28 @@ import (
 // MemBus is the in-memory Bus implementation. It assigns per-task monotonic
 // sequence numbers, retains history for replay, and never blocks publishers:
 // a slow subscriber's channel is drained oldest-first when full.
+// Subscribers are indexed by the task they follow ("" = all tasks), so a
+// publish touches only the followers of that task plus the global set —
+// not every open SSE stream on the engine.
 type MemBus struct {
-	mu      sync.Mutex
-	seq     map[string]int64
-	history map[string][]Event
-	subs    map[int]*subscriber
-	nextSub int
+	mu       sync.Mutex
+	seq      map[string]int64
+	history  map[string][]Event
+	taskSubs map[string]map[int]*subscriber
+	nextSub  int
 }
 
 type subscriber struct {
-	taskID string // "" = all tasks
-	ch     chan Event
+	ch chan Event
 }
 
 const subBuffer = 1024
 
 func NewBus() *MemBus {
 	return &MemBus{
-		seq:     make(map[string]int64),
-		history: make(map[string][]Event),
-		subs:    make(map[int]*subscriber),
+		seq:      make(map[string]int64),
+		history:  make(map[string][]Event),
+		taskSubs: make(map[string]map[int]*subscriber),
 	}
 }
 
@@ -39,11 +41,20 @@ func (b *MemBus) Publish(ev Event) {
 		ev.TS = time.Now().UnixMilli()
 	}
 	b.history[ev.TaskID] = append(b.history[ev.TaskID], ev)
-	subs := make([]*subscriber, 0, len(b.subs))
-	for _, s := range b.subs {
-		if s.taskID == "" || s.taskID == ev.TaskID {
-			subs = append(subs, s)
-		}
+	global := b.taskSubs[""]
+	var task map[int]*subscriber
+	if ev.TaskID != "" {
+		// Guard: an event published without a TaskID matches only the
+		// follow-all set — collecting taskSubs[""] twice would deliver it
+		// twice to every follow-all subscriber.
+		task = b.taskSubs[ev.TaskID]
+	}
+	subs := make([]*subscriber, 0, len(task)+len(global))
+	for _, s := range task {
+		subs = append(subs, s)
+	}
+	for _, s := range global {
+		subs = append(subs, s)
 	}
 	b.mu.Unlock()
 
@@ -71,18 +82,24 @@ func (b *MemBus) Subscribe(taskID string) (<-chan Event, func()) {
 	// Size the buffer to hold the full replay so history can be loaded while
 	// the lock is held — no publish can interleave, ordering is preserved.
 	replay := b.history[taskID]
-	s := &subscriber{taskID: taskID, ch: make(chan Event, len(replay)+subBuffer)}
+	s := &subscriber{ch: make(chan Event, len(replay)+subBuffer)}
 	if taskID != "" {
 		for _, ev := range replay {
 			s.ch <- ev
 		}
 	}
-	b.subs[id] = s
+	if b.taskSubs[taskID] == nil {
+		b.taskSubs[taskID] = make(map[int]*subscriber)
+	}
+	b.taskSubs[taskID][id] = s
 	b.mu.Unlock()
 
 	cancel := func() {
 		b.mu.Lock()
-		delete(b.subs, id)
+		delete(b.taskSubs[taskID], id)
+		if len(b.taskSubs[taskID]) == 0 {
+			delete(b.taskSubs, taskID)
+		}
 		b.mu.Unlock()
 	}
 	return s.ch, cancel
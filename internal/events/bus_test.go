@@ -0,0 +1,86 @@
+package events
+
+import "testing"
+
+// drainN receives exactly n buffered events without blocking on more.
+func drainN(t *testing.T, ch <-chan Event, n int) []Event {
+	t.Helper()
+	out := make([]Event, 0, n)
+	for len(out) < n {
+		select {
+		case ev := <-ch:
+			out = append(out, ev)
+		default:
+			t.Fatalf("channel drained after %d events, want %d", len(out), n)
+		}
+	}
+	return out
+}
+
+func TestPublishRoutesByTask(t *testing.T) {
+	b := NewBus()
+	chA, cancelA := b.Subscribe("a")
+	defer cancelA()
+	chAll, cancelAll := b.Subscribe("")
+	defer cancelAll()
+
+	b.Publish(Event{TaskID: "a", Kind: KindTaskReceived})
+	b.Publish(Event{TaskID: "b", Kind: KindTaskReceived})
+
+	got := drainN(t, chA, 1)
+	if got[0].TaskID != "a" {
+		t.Fatalf("task subscriber got %q", got[0].TaskID)
+	}
+	select {
+	case ev := <-chA:
+		t.Fatalf("task subscriber received another task's event: %+v", ev)
+	default:
+	}
+	all := drainN(t, chAll, 2)
+	if all[0].TaskID != "a" || all[1].TaskID != "b" {
+		t.Fatalf("follow-all subscriber got %+v", all)
+	}
+}
+
+// An event published without a TaskID matches only the follow-all set —
+// it must be delivered exactly once, not once as "its task" and once as
+// a global match.
+func TestEmptyTaskIDDeliversOnce(t *testing.T) {
+	b := NewBus()
+	ch, cancel := b.Subscribe("")
+	defer cancel()
+
+	b.Publish(Event{Kind: KindError})
+
+	drainN(t, ch, 1)
+	select {
+	case ev := <-ch:
+		t.Fatalf("event delivered twice: %+v", ev)
+	default:
+	}
+}
+
+func TestSubscribeReplaysHistory(t *testing.T) {
+	b := NewBus()
+	b.Publish(Event{TaskID: "a", Kind: KindTaskReceived})
+	b.Publish(Event{TaskID: "a", Kind: KindTaskFinal})
+
+	ch, cancel := b.Subscribe("a")
+	defer cancel()
+	got := drainN(t, ch, 2)
+	if got[0].Kind != KindTaskReceived || got[1].Kind != KindTaskFinal || got[0].Seq != 0 || got[1].Seq != 1 {
+		t.Fatalf("replay out of order: %+v", got)
+	}
+}
+
+func TestCancelStopsDelivery(t *testing.T) {
+	b := NewBus()
+	ch, cancel := b.Subscribe("a")
+	cancel()
+	b.Publish(Event{TaskID: "a", Kind: KindTaskReceived})
+	select {
+	case ev := <-ch:
+		t.Fatalf("cancelled subscriber still received %+v", ev)
+	default:
+	}
+}
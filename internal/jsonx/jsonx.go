@@ -28,39 +28,55 @@ func Parse(raw string, v any) error {
 			return nil
 		}
 	}
-	// Extract the first balanced {...} block, respecting strings/escapes.
-	if obj, ok := firstObject(s); ok {
-		return json.Unmarshal([]byte(obj), v)
+	// Extract the first balanced {...} block and decode it. Candidates that
+	// are not valid JSON on their own are skipped — by their whole balanced
+	// extent, never into their interior: retrying at an embedded object would
+	// let a nested value like {"name":"code"} "succeed" against any verdict
+	// struct (unknown fields are ignored) after the outer decode had already
+	// half-populated v. A valid candidate that doesn't fit v is an error;
+	// callers rely on that to fail open (gate → slow, classifier → fallback).
+	for from := 0; ; {
+		start, end, ok := objectRange(s, from)
+		if !ok {
+			break
+		}
+		if candidate := []byte(s[start:end]); json.Valid(candidate) {
+			return json.Unmarshal(candidate, v)
+		}
+		from = end
 	}
 	return fmt.Errorf("no JSON object found in model output")
 }
 
 // ParseLast decodes the LAST balanced JSON object in the text into v. Used
 // for prose-then-verdict outputs (e.g. council rebuttal followed by a vote).
+// The scan advances by byte offsets — one pass over the text, no substring
+// is materialized until the winning object is decoded.
 func ParseLast(raw string, v any) error {
 	s := strings.TrimSpace(raw)
-	last := ""
-	rest := s
-	for {
-		obj, ok := firstObject(rest)
+	lastStart, lastEnd := -1, -1
+	for from := 0; ; {
+		start, end, ok := objectRange(s, from)
 		if !ok {
 			break
 		}
-		idx := strings.Index(rest, obj)
-		last = obj
-		rest = rest[idx+len(obj):]
+		lastStart, lastEnd = start, end
+		from = end
 	}
-	if last == "" {
+	if lastStart < 0 {
 		return fmt.Errorf("no JSON object found in model output")
 	}
-	return json.Unmarshal([]byte(last), v)
+	return json.Unmarshal([]byte(s[lastStart:lastEnd]), v)
 }
 
-func firstObject(s string) (string, bool) {
-	start := strings.IndexByte(s, '{')
-	if start < 0 {
-		return "", false
+// objectRange returns the half-open byte range of the first balanced {...}
+// block at or after from, respecting strings/escapes.
+func objectRange(s string, from int) (start, end int, ok bool) {
+	idx := strings.IndexByte(s[from:], '{')
+	if idx < 0 {
+		return 0, 0, false
 	}
+	start = from + idx
 	depth := 0
 	inStr := false
 	escaped := false
@@ -78,9 +94,9 @@ func firstObject(s string) (string, bool) {
 		case !inStr && c == '}':
 			depth--
 			if depth == 0 {
-				return s[start : i+1], true
+				return start, i + 1, true
 			}
 		}
 	}
-	return "", false
+	return 0, 0, false
 }
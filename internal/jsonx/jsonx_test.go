@@ -0,0 +1,76 @@
+package jsonx
+
+import "testing"
+
+// verdict mirrors the shape of the classifier/gate verdict structs that
+// Parse is fed in production.
+type verdict struct {
+	Complexity string  `json:"complexity"`
+	Domain     string  `json:"domain"`
+	Confidence float64 `json:"confidence"`
+}
+
+func TestParseTolerantForms(t *testing.T) {
+	want := verdict{Complexity: "hard", Domain: "code", Confidence: 0.9}
+	cases := []struct {
+		name string
+		in   string
+	}{
+		{"bare object", `{"complexity":"hard","domain":"code","confidence":0.9}`},
+		{"fenced", "```json\n{\"complexity\":\"hard\",\"domain\":\"code\",\"confidence\":0.9}\n```"},
+		{"prose wrapped", "Here is my verdict:\n{\"complexity\":\"hard\",\"domain\":\"code\",\"confidence\":0.9}\nHope that helps."},
+	}
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			var v verdict
+			if err := Parse(tc.in, &v); err != nil {
+				t.Fatal(err)
+			}
+			if v != want {
+				t.Fatalf("got %+v, want %+v", v, want)
+			}
+		})
+	}
+}
+
+// A valid object whose fields don't fit the target must error — callers
+// fail open on that (gate → slow, classifier → fallback class). Parse must
+// not retry at the embedded {"name":"code"}, which would decode "cleanly"
+// into any verdict struct and return nil with a half-populated value.
+func TestParseMismatchedShapeFailsSafe(t *testing.T) {
+	var v verdict
+	err := Parse(`{"complexity":"hard","domain":{"name":"code"},"confidence":"high"}`, &v)
+	if err == nil {
+		t.Fatalf("want error for mismatched field types, got nil with %+v", v)
+	}
+}
+
+func TestParseNoObject(t *testing.T) {
+	var v verdict
+	if err := Parse("no json here, sorry", &v); err == nil {
+		t.Fatal("want error when the text contains no JSON object")
+	}
+}
+
+func TestParseLastPicksFinalObject(t *testing.T) {
+	in := `I first leaned toward {"choice":"A","confidence":0.4}.
+Reconsidering the rebuttals:
+{"choice":"B","confidence":0.8}`
+	var got struct {
+		Choice     string  `json:"choice"`
+		Confidence float64 `json:"confidence"`
+	}
+	if err := ParseLast(in, &got); err != nil {
+		t.Fatal(err)
+	}
+	if got.Choice != "B" || got.Confidence != 0.8 {
+		t.Fatalf("got %+v, want the last object", got)
+	}
+}
+
+func TestParseLastNoObject(t *testing.T) {
+	var v verdict
+	if err := ParseLast("prose only", &v); err == nil {
+		t.Fatal("want error when the text contains no JSON object")
+	}
+}
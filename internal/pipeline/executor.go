@@ -31,8 +31,15 @@ type Executor struct {
 func (e *Executor) Execute(ctx context.Context, stages []Stage, st *State) (*State, error) {
 	emit := events.EmitterFor(e.Bus, st.TaskID)
 
+	// Build the completed-stage set once instead of scanning Checkpoints per
+	// stage — checkpoints accumulate across resumes of long pipelines.
+	done := make(map[string]bool, len(st.Checkpoints))
+	for _, id := range st.Checkpoints {
+		done[id] = true
+	}
+
 	for _, stage := range stages {
-		if st.Checkpointed(stage.ID()) {
+		if done[stage.ID()] {
 			continue // resume: skip completed stages
 		}
 
@@ -100,11 +107,13 @@ func (e *Executor) Execute(ctx context.Context, stages []Stage, st *State) (*Sta
 		})
 	}
 
-	// Terminal: promote Draft→Final if no stage set Final explicitly.
+	// Terminal: promote Draft→Final if no stage set Final explicitly. The
+	// last stage's checkpoint already persisted the state, so a fresh save is
+	// needed only when the promotion actually changed it.
 	if st.Final == "" {
 		st.Final = st.Draft
+		e.persist(st, emit)
 	}
-	e.persist(st, emit)
 	e.emitFinal(st, emit, "completed")
 	return st, nil
 }
@@ -6,6 +6,7 @@ import (
 	"context"
 	"slices"
 	"strings"
+	"sync"
 
 	"github.com/stukennedy/kyotee/internal/events"
 	"github.com/stukennedy/kyotee/internal/provider"
@@ -80,6 +81,13 @@ type State struct {
 	Budget      BudgetState       `json:"budget"`
 	Checkpoints []string          `json:"checkpoints"` // stage IDs completed, for resume
 	Meta        map[string]string `json:"meta"`
+
+	// promptOnce/promptBody memoize PromptBody: Original and History are
+	// fixed once a task starts, and the solver stages rebuild the prompt body
+	// for every member turn of every round. Not persisted; recomputed once
+	// after a resume.
+	promptOnce sync.Once
+	promptBody string
 }
 
 // Exchange is one completed user↔assistant turn carried forward as
@@ -101,6 +109,11 @@ func (s *State) PromptBody() string {
 	if len(s.History) == 0 {
 		return s.Original
 	}
+	s.promptOnce.Do(func() { s.promptBody = s.buildPromptBody() })
+	return s.promptBody
+}
+
+func (s *State) buildPromptBody() string {
 	var b strings.Builder
 	b.WriteString("This is a follow-up in an ongoing conversation. Earlier turns:\n\n")
 	for _, ex := range s.History {
@@ -115,12 +128,17 @@ func (s *State) PromptBody() string {
 	return b.String()
 }
 
+// truncateRunes cuts s after n runes without materializing a []rune copy:
+// the range loop yields rune-start byte offsets, so the cut is a substring.
 func truncateRunes(s string, n int) string {
-	r := []rune(s)
-	if len(r) <= n {
-		return s
+	count := 0
+	for i := range s {
+		if count == n {
+			return s[:i] + "…"
+		}
+		count++
 	}
-	return string(r[:n]) + "…"
+	return s
 }
 
 type Turn struct {
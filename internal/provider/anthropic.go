@@ -28,6 +28,12 @@ type Anthropic struct {
 
 const anthropicVersion = "2023-06-01"
 
+// defaultClient serves every adapter instance that doesn't inject its own.
+// Connection pooling was never at stake — a client with a nil Transport
+// shares http.DefaultTransport and its keep-alive pool — this just avoids
+// allocating a throwaway http.Client on every call.
+var defaultClient = &http.Client{Timeout: 5 * time.Minute}
+
 func (a *Anthropic) Name() string   { return a.ModelName }
 func (a *Anthropic) Vendor() string { return "anthropic" }
 
@@ -108,11 +114,6 @@ func (a *Anthropic) Generate(ctx context.Context, req Request) (Response, error)
 		delete(body, "temperature")
 	}
 
-	raw, err := a.post(ctx, body)
-	if err != nil {
-		return Response{}, err
-	}
-
 	var apiResp struct {
 		Content []struct {
 			Type      string          `json:"type"`
@@ -130,8 +131,8 @@ func (a *Anthropic) Generate(ctx context.Context, req Request) (Response, error)
 			OutputTokens int `json:"output_tokens"`
 		} `json:"usage"`
 	}
-	if err := json.Unmarshal(raw, &apiResp); err != nil {
-		return Response{}, fmt.Errorf("anthropic: decode response: %w", err)
+	if err := a.post(ctx, body, &apiResp); err != nil {
+		return Response{}, err
 	}
 
 	resp := Response{StopReason: apiResp.StopReason}
@@ -213,22 +214,25 @@ func (a *Anthropic) encodeMessages(msgs []Message) []anthropicMsg {
 	return out
 }
 
-func (a *Anthropic) post(ctx context.Context, body map[string]any) ([]byte, error) {
+// post sends the request and decodes a 200 response straight off the wire
+// into out — no intermediate buffer of the full body. Error bodies are read
+// only up to the length the error message can carry.
+func (a *Anthropic) post(ctx context.Context, body map[string]any, out any) error {
 	baseURL := a.BaseURL
 	if baseURL == "" {
 		baseURL = "https://api.anthropic.com/v1"
 	}
 	client := a.HTTPClient
 	if client == nil {
-		client = &http.Client{Timeout: 5 * time.Minute}
+		client = defaultClient
 	}
 	payload, err := json.Marshal(body)
 	if err != nil {
-		return nil, err
+		return err
 	}
 	httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, baseURL+"/messages", bytes.NewReader(payload))
 	if err != nil {
-		return nil, err
+		return err
 	}
 	httpReq.Header.Set("Content-Type", "application/json")
 	httpReq.Header.Set("x-api-key", a.APIKey)
@@ -236,17 +240,17 @@ func (a *Anthropic) post(ctx context.Context, body map[string]any) ([]byte, erro
 
 	resp, err := client.Do(httpReq)
 	if err != nil {
-		return nil, fmt.Errorf("anthropic: %w", err)
+		return fmt.Errorf("anthropic: %w", err)
 	}
 	defer resp.Body.Close()
-	raw, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
 	if resp.StatusCode != http.StatusOK {
-		return nil, fmt.Errorf("anthropic: status %d: %s", resp.StatusCode, truncate(string(raw), 500))
+		raw, _ := io.ReadAll(io.LimitReader(resp.Body, 1024))
+		return fmt.Errorf("anthropic: status %d: %s", resp.StatusCode, truncate(string(raw), 500))
+	}
+	if err := json.NewDecoder(resp.Body).Decode(out); err != nil {
+		return fmt.Errorf("anthropic: decode response: %w", err)
 	}
-	return raw, nil
+	return nil
 }
 
 func truncate(s string, n int) string {
@@ -94,11 +94,6 @@ func (o *OpenAICompat) Generate(ctx context.Context, req Request) (Response, err
 		}
 	}
 
-	raw, err := o.post(ctx, body)
-	if err != nil {
-		return Response{}, err
-	}
-
 	var apiResp struct {
 		Choices []struct {
 			FinishReason string `json:"finish_reason"`
@@ -118,8 +113,8 @@ func (o *OpenAICompat) Generate(ctx context.Context, req Request) (Response, err
 			CompletionTokens int `json:"completion_tokens"`
 		} `json:"usage"`
 	}
-	if err := json.Unmarshal(raw, &apiResp); err != nil {
-		return Response{}, fmt.Errorf("%s: decode response: %w", o.Vendor(), err)
+	if err := o.post(ctx, body, &apiResp); err != nil {
+		return Response{}, err
 	}
 	if len(apiResp.Choices) == 0 {
 		return Response{}, fmt.Errorf("%s: empty choices", o.Vendor())
@@ -208,22 +203,25 @@ func (o *OpenAICompat) encodeMessages(system string, msgs []Message) []map[strin
 	return out
 }
 
-func (o *OpenAICompat) post(ctx context.Context, body map[string]any) ([]byte, error) {
+// post sends the request and decodes a 200 response straight off the wire
+// into out — no intermediate buffer of the full body. Error bodies are read
+// only up to the length the error message can carry.
+func (o *OpenAICompat) post(ctx context.Context, body map[string]any, out any) error {
 	baseURL := o.BaseURL
 	if baseURL == "" {
 		baseURL = "https://api.openai.com/v1"
 	}
 	client := o.HTTPClient
 	if client == nil {
-		client = &http.Client{Timeout: 5 * time.Minute}
+		client = defaultClient
 	}
 	payload, err := json.Marshal(body)
 	if err != nil {
-		return nil, err
+		return err
 	}
 	httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, baseURL+"/chat/completions", bytes.NewReader(payload))
 	if err != nil {
-		return nil, err
+		return err
 	}
 	httpReq.Header.Set("Content-Type", "application/json")
 	if o.APIKey != "" {
@@ -231,19 +229,25 @@ func (o *OpenAICompat) post(ctx context.Context, body map[string]any) ([]byte, e
 	}
 	resp, err := client.Do(httpReq)
 	if err != nil {
-		return nil, fmt.Errorf("%s: %w", o.Vendor(), err)
+		return fmt.Errorf("%s: %w", o.Vendor(), err)
 	}
 	defer resp.Body.Close()
-	raw, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
 	if resp.StatusCode != http.StatusOK {
-		return nil, fmt.Errorf("%s: status %d: %s", o.Vendor(), resp.StatusCode, truncate(string(raw), 500))
+		raw, _ := io.ReadAll(io.LimitReader(resp.Body, 1024))
+		return fmt.Errorf("%s: status %d: %s", o.Vendor(), resp.StatusCode, truncate(string(raw), 500))
 	}
-	return raw, nil
+	if err := json.NewDecoder(resp.Body).Decode(out); err != nil {
+		return fmt.Errorf("%s: decode response: %w", o.Vendor(), err)
+	}
+	return nil
 }
 
+// defaultEmbedClient is the shared fallback for embedders without an
+// injected client — same deal as defaultClient: the transport (and its
+// connection pool) was always shared, this only skips the per-call
+// http.Client allocation.
+var defaultEmbedClient = &http.Client{Timeout: 2 * time.Minute}
+
 // OpenAIEmbedder implements the council's Embedder interface against an
 // OpenAI-compatible /embeddings endpoint.
 type OpenAIEmbedder struct {
@@ -260,7 +264,7 @@ func (e *OpenAIEmbedder) Embed(ctx context.Context, texts []string) ([][]float32
 	}
 	client := e.HTTPClient
 	if client == nil {
-		client = &http.Client{Timeout: 2 * time.Minute}
+		client = defaultEmbedClient
 	}
 	payload, err := json.Marshal(map[string]any{"model": e.ModelID, "input": texts})
 	if err != nil {
@@ -279,11 +283,8 @@ func (e *OpenAIEmbedder) Embed(ctx context.Context, texts []string) ([][]float32
 		return nil, err
 	}
 	defer resp.Body.Close()
-	raw, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, err
-	}
 	if resp.StatusCode != http.StatusOK {
+		raw, _ := io.ReadAll(io.LimitReader(resp.Body, 1024))
 		return nil, fmt.Errorf("embeddings: status %d: %s", resp.StatusCode, truncate(string(raw), 300))
 	}
 	var apiResp struct {
@@ -291,7 +292,7 @@ func (e *OpenAIEmbedder) Embed(ctx context.Context, texts []string) ([][]float32
 			Embedding []float32 `json:"embedding"`
 		} `json:"data"`
 	}
-	if err := json.Unmarshal(raw, &apiResp); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&apiResp); err != nil {
 		return nil, err
 	}
 	out := make([][]float32, len(apiResp.Data))
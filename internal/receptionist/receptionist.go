@@ -62,12 +62,8 @@ func (ov Overrides) Validate(cfg *config.Config) error {
 	default:
 		return fmt.Errorf("override consensus_method %q not in {vote, similarity, judge}", ov.ConsensusMethod)
 	}
-	known := map[string]bool{}
-	for _, p := range cfg.Providers {
-		known[p.Name] = true
-	}
 	for _, m := range append([]string{ov.Models.Primary, ov.Models.Divergent, ov.Models.Convergent}, ov.Models.Council...) {
-		if m != "" && !known[m] {
+		if m != "" && !cfg.KnownProvider(m) {
 			return fmt.Errorf("override references unknown provider %q", m)
 		}
 	}
@@ -274,6 +270,9 @@ func (r *Receptionist) assemble(route Route, cfg *config.Config, ov Overrides) (
 		if err != nil {
 			return nil, nil, nil, err
 		}
+		// Per-task load stays deliberately: the mtime cache in twobrain makes
+		// it one stat per file, and an operator prompt edit must take effect
+		// on the next task without a config reload.
 		prompts, err := twobrain.LoadPrompts(
 			cfg.TwoBrain.Prompts.Divergent, cfg.TwoBrain.Prompts.Convergent, cfg.TwoBrain.Prompts.Referee)
 		if err != nil {
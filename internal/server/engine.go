@@ -11,6 +11,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/stukennedy/kyotee/internal/config"
@@ -156,14 +157,13 @@ func (e *Engine) Submit(text string, ov receptionist.Overrides, threadID string)
 // timestamp prefix sorts lexicographically), or nil if the thread is unknown.
 // O(number of persisted tasks); fine for a single-user local store.
 func (e *Engine) threadTip(threadID string) *pipeline.State {
-	ids, err := e.Store.List()
+	states, err := e.Store.LoadAll()
 	if err != nil {
 		return nil
 	}
 	var tip *pipeline.State
-	for _, id := range ids {
-		st, err := e.Store.Load(id)
-		if err != nil || st.ThreadID != threadID {
+	for _, st := range states {
+		if st.ThreadID != threadID {
 			continue
 		}
 		if tip == nil || st.TaskID > tip.TaskID {
@@ -250,7 +250,7 @@ type TaskInfo struct {
 }
 
 func (e *Engine) Tasks() ([]TaskInfo, error) {
-	ids, err := e.Store.List()
+	states, err := e.Store.LoadAll()
 	if err != nil {
 		return nil, err
 	}
@@ -261,15 +261,11 @@ func (e *Engine) Tasks() ([]TaskInfo, error) {
 	}
 	e.mu.Unlock()
 
-	out := make([]TaskInfo, 0, len(ids))
-	for _, id := range ids {
-		st, err := e.Store.Load(id)
-		if err != nil {
-			continue
-		}
+	out := make([]TaskInfo, 0, len(states))
+	for _, st := range states {
 		out = append(out, TaskInfo{
-			TaskID: id, ThreadID: st.ThreadID, Original: st.Original, Final: st.Final,
-			Running: runningSnapshot[id], SpentUSD: st.Budget.SpentUSD,
+			TaskID: st.TaskID, ThreadID: st.ThreadID, Original: st.Original, Final: st.Final,
+			Running: runningSnapshot[st.TaskID], SpentUSD: st.Budget.SpentUSD,
 		})
 	}
 	return out, nil
@@ -304,8 +300,15 @@ func (e *Engine) Providers() []ProviderInfo {
 	return out
 }
 
+// taskSeq disambiguates IDs minted within the same second. Thread-tip
+// selection orders tasks lexicographically by ID, so two rapid submissions
+// must still sort in creation order — the timestamp alone only resolves to
+// one second, and the random suffix sorts arbitrarily.
+var taskSeq atomic.Uint32
+
 func newTaskID() string {
 	b := make([]byte, 4)
 	_, _ = rand.Read(b)
-	return time.Now().UTC().Format("20060102-150405") + "-" + hex.EncodeToString(b)
+	return time.Now().UTC().Format("20060102-150405") +
+		fmt.Sprintf("-%04x-", taskSeq.Add(1)&0xffff) + hex.EncodeToString(b)
 }
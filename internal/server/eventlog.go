@@ -19,11 +19,22 @@ import (
 type eventLog struct {
 	dir   string
 	mu    sync.Mutex
-	files map[string]*os.File
+	files map[string]*logFile
+}
+
+// logFile pairs a task's open log with an encoder bound to it, so each
+// event is serialized straight onto the file (Encode appends the newline)
+// instead of through an intermediate buffer copied per append. The writer
+// batches a burst of events into one write syscall; drain flushes as soon
+// as the bus goes quiet, so nothing sits buffered while the task is idle.
+type logFile struct {
+	f   *os.File
+	w   *bufio.Writer
+	enc *json.Encoder
 }
 
 func newEventLog(dir string) *eventLog {
-	return &eventLog{dir: dir, files: map[string]*os.File{}}
+	return &eventLog{dir: dir, files: map[string]*logFile{}}
 }
 
 func (l *eventLog) path(taskID string) string {
@@ -39,39 +50,66 @@ func (l *eventLog) path(taskID string) string {
 
 // drain appends each event from an already-open subscription as one JSON
 // line. The caller subscribes BEFORE any task can publish (engine startup),
-// so the log never misses head events.
+// so the log never misses head events. Events already queued on the channel
+// are appended before flushing, so a burst (parallel council turns) costs
+// one write per file, not one per event.
 func (l *eventLog) drain(ch <-chan events.Event) {
 	for ev := range ch {
 		l.append(ev)
+	drainQueued:
+		for {
+			select {
+			case next, open := <-ch:
+				if !open {
+					break drainQueued
+				}
+				l.append(next)
+			default:
+				break drainQueued
+			}
+		}
+		l.flush()
 	}
 }
 
-func (l *eventLog) append(ev events.Event) {
-	data, err := json.Marshal(ev)
-	if err != nil {
-		return
+// flush pushes every open log's buffered events to disk.
+func (l *eventLog) flush() {
+	l.mu.Lock()
+	defer l.mu.Unlock()
+	for _, lf := range l.files {
+		lf.w.Flush()
 	}
+}
+
+func (l *eventLog) append(ev events.Event) {
 	l.mu.Lock()
 	defer l.mu.Unlock()
-	f, ok := l.files[ev.TaskID]
+	lf, ok := l.files[ev.TaskID]
 	if !ok {
-		f, err = os.OpenFile(l.path(ev.TaskID), os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0o644)
+		f, err := os.OpenFile(l.path(ev.TaskID), os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0o644)
 		if err != nil {
 			return
 		}
-		l.files[ev.TaskID] = f
+		w := bufio.NewWriter(f)
+		lf = &logFile{f: f, w: w, enc: json.NewEncoder(w)}
+		l.files[ev.TaskID] = lf
 	}
-	f.Write(append(data, '\n'))
+	_ = lf.enc.Encode(ev)
 	if terminalEvent(ev) {
-		f.Close()
+		lf.w.Flush()
+		lf.f.Close()
 		delete(l.files, ev.TaskID)
 	}
 }
 
-// read returns the persisted events for a task, in file (Seq) order.
+// read returns the persisted events for a task, in file (Seq) order. A
+// still-open log is flushed first so replay never misses batched events.
 func (l *eventLog) read(taskID string) []events.Event {
 	l.mu.Lock()
 	defer l.mu.Unlock()
+	if lf, ok := l.files[taskID]; ok {
+		lf.w.Flush()
+	}
 	f, err := os.Open(l.path(taskID))
 	if err != nil {
 		return nil
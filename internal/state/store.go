@@ -51,23 +51,29 @@ func (s *FileStore) path(taskID string) string {
 }
 
 func (s *FileStore) Save(st *pipeline.State) error {
-	data, err := json.MarshalIndent(st, "", "  ")
-	if err != nil {
-		return fmt.Errorf("marshal state: %w", err)
-	}
-	tmp, err := os.CreateTemp(s.Dir, ".tmp-*")
+	// Deterministic sibling temp path: per-task saves are serialized by the
+	// executor, so CreateTemp's random-name retry loop buys nothing here and
+	// costs an extra open attempt per checkpoint.
+	p := s.path(st.TaskID)
+	tmpPath := p + ".tmp"
+	tmp, err := os.OpenFile(tmpPath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0o644)
 	if err != nil {
 		return err
 	}
-	defer os.Remove(tmp.Name())
-	if _, err := tmp.Write(data); err != nil {
+	defer os.Remove(tmpPath)
+	// Encode straight into the temp file — the executor checkpoints after
+	// every stage, and a long transcript would otherwise be materialized as
+	// one big indented byte slice per checkpoint.
+	enc := json.NewEncoder(tmp)
+	enc.SetIndent("", "  ")
+	if err := enc.Encode(st); err != nil {
 		tmp.Close()
-		return err
+		return fmt.Errorf("marshal state: %w", err)
 	}
 	if err := tmp.Close(); err != nil {
 		return err
 	}
-	return os.Rename(tmp.Name(), s.path(st.TaskID))
+	return os.Rename(tmpPath, p)
 }
 
 func (s *FileStore) Load(taskID string) (*pipeline.State, error) {
@@ -75,6 +81,10 @@ func (s *FileStore) Load(taskID string) (*pipeline.State, error) {
 	if err != nil {
 		return nil, err
 	}
+	return decodeState(data, taskID)
+}
+
+func decodeState(data []byte, taskID string) (*pipeline.State, error) {
 	var st pipeline.State
 	if err := json.Unmarshal(data, &st); err != nil {
 		return nil, fmt.Errorf("unmarshal state %s: %w", taskID, err)
@@ -85,6 +95,35 @@ func (s *FileStore) Load(taskID string) (*pipeline.State, error) {
 	return &st, nil
 }
 
+// LoadAll reads every persisted task state in one directory pass, sorted by
+// task ID. Callers that need the whole store (task listing, thread-tip
+// lookup) use this instead of List + Load-per-ID, which walks the directory
+// and re-derives each path separately. Unreadable entries are skipped — a
+// corrupt state file must not hide every other task.
+func (s *FileStore) LoadAll() ([]*pipeline.State, error) {
+	entries, err := os.ReadDir(s.Dir)
+	if err != nil {
+		return nil, err
+	}
+	var out []*pipeline.State
+	for _, e := range entries {
+		if e.IsDir() || !strings.HasSuffix(e.Name(), ".json") {
+			continue
+		}
+		data, err := os.ReadFile(filepath.Join(s.Dir, e.Name()))
+		if err != nil {
+			continue
+		}
+		st, err := decodeState(data, strings.TrimSuffix(e.Name(), ".json"))
+		if err != nil {
+			continue
+		}
+		out = append(out, st)
+	}
+	sort.Slice(out, func(i, j int) bool { return out[i].TaskID < out[j].TaskID })
+	return out, nil
+}
+
 func (s *FileStore) List() ([]string, error) {
 	entries, err := os.ReadDir(s.Dir)
 	if err != nil {
@@ -6,6 +6,7 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 
 	"github.com/stukennedy/kyotee/internal/provider"
 )
@@ -15,6 +16,15 @@ import (
 type FileRead struct {
 	name string
 	root string
+
+	// The root is fixed for the registry's lifetime (registries are rebuilt
+	// on config reload), so its Abs + EvalSymlinks resolution is cached —
+	// but only on success: a root that doesn't resolve yet (directory not
+	// created, mount not up) must be retried on the next call, not latched
+	// as a permanent error. Targets are still resolved per call: they change.
+	rootMu   sync.Mutex
+	rootAbs  string
+	rootReal string
 }
 
 func NewFileRead(name, root string) *FileRead {
@@ -43,21 +53,37 @@ func (f *FileRead) Def() provider.ToolDef {
 
 const fileReadLimit = 64 * 1024
 
-func (f *FileRead) Exec(_ context.Context, input map[string]any) (string, error) {
-	rel, _ := input["path"].(string)
-	if strings.TrimSpace(rel) == "" {
-		return "", fmt.Errorf("%s: empty path", f.name)
+// resolveRoot returns the absolute and symlink-resolved sandbox root,
+// computing them on first success and serving the cache afterwards.
+func (f *FileRead) resolveRoot() (abs, real string, err error) {
+	f.rootMu.Lock()
+	defer f.rootMu.Unlock()
+	if f.rootReal != "" {
+		return f.rootAbs, f.rootReal, nil
 	}
-	rootAbs, err := filepath.Abs(f.root)
+	abs, err = filepath.Abs(f.root)
 	if err != nil {
-		return "", err
+		return "", "", err
 	}
 	// Resolve symlinks on BOTH sides before the containment check — a
 	// symlink inside the root must not smuggle out-of-sandbox files into
 	// model prompts.
-	root, err := filepath.EvalSymlinks(rootAbs)
+	real, err = filepath.EvalSymlinks(abs)
+	if err != nil {
+		return "", "", fmt.Errorf("%s: resolve root: %w", f.name, err)
+	}
+	f.rootAbs, f.rootReal = abs, real
+	return abs, real, nil
+}
+
+func (f *FileRead) Exec(_ context.Context, input map[string]any) (string, error) {
+	rel, _ := input["path"].(string)
+	if strings.TrimSpace(rel) == "" {
+		return "", fmt.Errorf("%s: empty path", f.name)
+	}
+	rootAbs, root, err := f.resolveRoot()
 	if err != nil {
-		return "", fmt.Errorf("%s: resolve root: %w", f.name, err)
+		return "", err
 	}
 	target, err := filepath.EvalSymlinks(filepath.Join(rootAbs, rel))
 	if err != nil {
@@ -3,6 +3,7 @@ package thinking
 import (
 	"context"
 	"encoding/json"
+	"sync"
 
 	"github.com/stukennedy/kyotee/internal/events"
 	"github.com/stukennedy/kyotee/internal/provider"
@@ -35,39 +36,56 @@ func RunToolLoop(ctx context.Context, p provider.Provider, req provider.Request,
 			return resp, total, nil
 		}
 
-		// Record the assistant turn, then execute each requested tool.
+		// Record the assistant turn, then execute the requested tools. Calls
+		// within one turn are independent (no shared state between tools), so
+		// they run in parallel — wall time is the slowest call, not the sum.
+		// The cap is applied up front, sequentially, to keep the deterministic
+		// "first maxCalls execute, the rest are refused" semantics; tool.call
+		// events go out in request order before execution and tool.result
+		// events in the same order after, so the stream stays readable.
 		req.Messages = append(req.Messages, provider.Message{Role: "assistant", Content: resp.Content})
-		var results []provider.Block
-		for _, call := range calls {
+		outputs := make([]string, len(calls))
+		isErrs := make([]bool, len(calls))
+		var wg sync.WaitGroup
+		for i, call := range calls {
 			inputJSON, _ := json.Marshal(call.Input)
 			emit(events.Event{
 				Kind: events.KindToolCall, Stage: stage, Actor: p.Name(),
 				Payload: map[string]any{"name": call.Name, "input": string(inputJSON)},
 			})
 
-			var output string
-			var isErr bool
 			if callsUsed >= maxCalls {
-				output = "Tool call limit reached. Answer now with the information you already have."
-				isErr = true
-			} else if tool, ok := reg.Get(call.Name); ok {
-				out, execErr := tool.Exec(ctx, call.Input)
+				outputs[i] = "Tool call limit reached. Answer now with the information you already have."
+				isErrs[i] = true
+				continue
+			}
+			tool, ok := reg.Get(call.Name)
+			if !ok {
+				outputs[i], isErrs[i] = "unknown tool: "+call.Name, true
+				continue
+			}
+			callsUsed++
+			wg.Add(1)
+			go func(i int, tool Tool, input map[string]any) {
+				defer wg.Done()
+				out, execErr := tool.Exec(ctx, input)
 				if execErr != nil {
-					output, isErr = "tool error: "+execErr.Error(), true
-				} else {
-					output = out
+					outputs[i], isErrs[i] = "tool error: "+execErr.Error(), true
+					return
 				}
-				callsUsed++
-			} else {
-				output, isErr = "unknown tool: "+call.Name, true
-			}
+				outputs[i] = out
+			}(i, tool, call.Input)
+		}
+		wg.Wait()
 
+		results := make([]provider.Block, 0, len(calls))
+		for i, call := range calls {
 			emit(events.Event{
 				Kind: events.KindToolResult, Stage: stage, Actor: p.Name(),
-				Payload: map[string]any{"name": call.Name, "output": truncateStr(output, 2000), "is_error": isErr},
+				Payload: map[string]any{"name": call.Name, "output": truncateStr(outputs[i], 2000), "is_error": isErrs[i]},
 			})
 			results = append(results, provider.Block{Type: "tool_result", ToolResult: &provider.ToolResult{
-				CallID: call.ID, Content: output, IsError: isErr,
+				CallID: call.ID, Content: outputs[i], IsError: isErrs[i],
 			}})
 		}
 		req.Messages = append(req.Messages, provider.Message{Role: "tool", Content: results})
@@ -0,0 +1,173 @@
+package thinking
+
+import (
+	"context"
+	"fmt"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/stukennedy/kyotee/internal/events"
+	"github.com/stukennedy/kyotee/internal/provider"
+)
+
+// trackingTool echoes its query after a short sleep, errors on "boom", and
+// records how many executions overlapped — the proof the loop actually ran
+// a turn's calls in parallel, not just that the answers came back.
+type trackingTool struct {
+	mu          sync.Mutex
+	executed    int
+	inFlight    int
+	maxInFlight int
+}
+
+func (tt *trackingTool) registry() *ToolRegistry {
+	return NewToolRegistry(&FuncTool{
+		Definition: provider.ToolDef{
+			Name:        "web_search",
+			Description: "search the web",
+			Schema:      map[string]any{"type": "object", "properties": map[string]any{"query": map[string]any{"type": "string"}}},
+		},
+		Fn: func(_ context.Context, input map[string]any) (string, error) {
+			tt.mu.Lock()
+			tt.executed++
+			tt.inFlight++
+			if tt.inFlight > tt.maxInFlight {
+				tt.maxInFlight = tt.inFlight
+			}
+			tt.mu.Unlock()
+			defer func() {
+				tt.mu.Lock()
+				tt.inFlight--
+				tt.mu.Unlock()
+			}()
+			time.Sleep(20 * time.Millisecond)
+			q, _ := input["query"].(string)
+			if q == "boom" {
+				return "", fmt.Errorf("no results")
+			}
+			return "echo:" + q, nil
+		},
+	})
+}
+
+// multiCallTurn scripts a model whose first turn requests one tool call per
+// query, then answers with final once the loop feeds results back.
+func multiCallTurn(final string, queries ...string) *provider.Fake {
+	blocks := make([]provider.Block, 0, len(queries))
+	for i, q := range queries {
+		blocks = append(blocks, provider.Block{Type: "tool_use", ToolCall: &provider.ToolCall{
+			ID: fmt.Sprintf("c%d", i), Name: "web_search", Input: map[string]any{"query": q},
+		}})
+	}
+	return &provider.Fake{ModelName: "solver", VendorName: "anthropic",
+		ScriptFn: func(call int, req provider.Request) (provider.Response, error) {
+			if call == 0 {
+				return provider.Response{Content: blocks, StopReason: "tool_use",
+					Usage: provider.Usage{InputTokens: 10, OutputTokens: 10}}, nil
+			}
+			return provider.TextResponse(final, 10, 10), nil
+		}}
+}
+
+// Three calls in one turn: they must overlap, results must land on the
+// right CallIDs regardless of completion order, and all tool.call events
+// must precede all tool.result events, both in request order.
+func TestToolLoopParallelCallsKeepOrder(t *testing.T) {
+	tt := &trackingTool{}
+	tools := tt.registry()
+	solver := multiCallTurn("done", "a", "boom", "c")
+	emit, evs := collect()
+
+	req := provider.Request{Messages: []provider.Message{provider.UserText("go")}, Tools: tools.Defs()}
+	resp, _, err := RunToolLoop(context.Background(), solver, req, tools, 5, emit, "solo")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if resp.Text() != "done" {
+		t.Fatalf("loop did not reach the final answer: %q", resp.Text())
+	}
+	if tt.maxInFlight < 2 {
+		t.Fatalf("tool calls did not overlap (max in flight %d)", tt.maxInFlight)
+	}
+
+	// CallID → result mapping, independent of which goroutine finished first.
+	last := solver.Requests[1].Messages[len(solver.Requests[1].Messages)-1]
+	if last.Role != "tool" || len(last.Content) != 3 {
+		t.Fatalf("expected one tool message with 3 results, got %+v", last)
+	}
+	want := []struct {
+		callID, content string
+		isError         bool
+	}{
+		{"c0", "echo:a", false},
+		{"c1", "tool error: no results", true},
+		{"c2", "echo:c", false},
+	}
+	for i, w := range want {
+		r := last.Content[i].ToolResult
+		if r == nil || r.CallID != w.callID || r.Content != w.content || r.IsError != w.isError {
+			t.Fatalf("result %d = %+v, want %+v", i, last.Content[i].ToolResult, w)
+		}
+	}
+
+	// Event stream: calls first, then results, each in request order.
+	calls, results := kinds(*evs, events.KindToolCall), kinds(*evs, events.KindToolResult)
+	if len(calls) != 3 || len(results) != 3 {
+		t.Fatalf("want 3 tool.call + 3 tool.result events, got %d + %d", len(calls), len(results))
+	}
+	for i, ev := range results {
+		if out, _ := ev.Payload["output"].(string); out != want[i].content {
+			t.Fatalf("tool.result %d out of order: %q", i, out)
+		}
+	}
+	lastCall, firstResult := -1, -1
+	for i, ev := range *evs {
+		switch ev.Kind {
+		case events.KindToolCall:
+			lastCall = i
+		case events.KindToolResult:
+			if firstResult < 0 {
+				firstResult = i
+			}
+		}
+	}
+	if firstResult < lastCall {
+		t.Fatal("every tool.call event must precede the first tool.result")
+	}
+}
+
+// A turn that crosses the cap partway: the first maxCalls requests execute,
+// the rest are refused deterministically, and the loop still forces a final
+// tool-free answer.
+func TestToolLoopCapCrossedMidTurn(t *testing.T) {
+	tt := &trackingTool{}
+	tools := tt.registry()
+	solver := multiCallTurn("final", "a", "b", "c")
+	emit, _ := collect()
+
+	req := provider.Request{Messages: []provider.Message{provider.UserText("go")}, Tools: tools.Defs()}
+	resp, _, err := RunToolLoop(context.Background(), solver, req, tools, 2, emit, "solo")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if resp.Text() != "final" {
+		t.Fatalf("loop did not force a final answer: %q", resp.Text())
+	}
+	if tt.executed != 2 {
+		t.Fatalf("cap of 2 must execute exactly 2 calls, ran %d", tt.executed)
+	}
+	last := solver.Requests[1].Messages[len(solver.Requests[1].Messages)-1]
+	if last.Role != "tool" || len(last.Content) != 3 {
+		t.Fatalf("expected one tool message with 3 results, got %+v", last)
+	}
+	refused := last.Content[2].ToolResult
+	if refused == nil || refused.CallID != "c2" || !refused.IsError ||
+		!strings.Contains(refused.Content, "Tool call limit reached") {
+		t.Fatalf("third call must be refused by the cap, got %+v", refused)
+	}
+	if solver.Requests[1].ToolChoice != "none" {
+		t.Fatal("cap must force ToolChoice=none on the follow-up request")
+	}
+}
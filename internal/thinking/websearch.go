@@ -44,6 +44,12 @@ var (
 	ddgResultRe  = regexp.MustCompile(`(?s)<a[^>]+class="result__a"[^>]*href="([^"]+)"[^>]*>(.*?)</a>`)
 	ddgSnippetRe = regexp.MustCompile(`(?s)<a[^>]+class="result__snippet"[^>]*>(.*?)</a>`)
 	tagRe        = regexp.MustCompile(`<[^>]+>`)
+
+	// defaultSearchClient is the shared fallback for searches without an
+	// injected client. Pooled connections were already shared through
+	// http.DefaultTransport (nil Transport); this only saves constructing
+	// an http.Client per query.
+	defaultSearchClient = &http.Client{Timeout: 30 * time.Second}
 )
 
 func (w *WebSearch) Exec(ctx context.Context, input map[string]any) (string, error) {
@@ -58,7 +64,7 @@ func (w *WebSearch) Exec(ctx context.Context, input map[string]any) (string, err
 	}
 	client := w.HTTPClient
 	if client == nil {
-		client = &http.Client{Timeout: 30 * time.Second}
+		client = defaultSearchClient
 	}
 	maxResults := w.MaxResults
 	if maxResults == 0 {
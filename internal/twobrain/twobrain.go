@@ -12,6 +12,8 @@ import (
 	"fmt"
 	"os"
 	"strings"
+	"sync"
+	"time"
 
 	"github.com/stukennedy/kyotee/internal/budget"
 	"github.com/stukennedy/kyotee/internal/events"
@@ -43,6 +45,20 @@ var DefaultPrompts = Prompts{
 	Referee:    "You are the REFEREE of a two-brain exchange. Read the full debate and produce the final answer to the user's task, taking the best of the divergent exploration and the convergent critique. Answer the user directly.",
 }
 
+// promptCache memoizes prompt files by path, keyed on size+mtime so an
+// operator edit is picked up on the next task — the common case (identical
+// bytes loaded for every twobrain task) costs one stat instead of a read.
+var (
+	promptMu    sync.Mutex
+	promptCache = map[string]promptEntry{}
+)
+
+type promptEntry struct {
+	size    int64
+	modTime time.Time
+	text    string
+}
+
 // LoadPrompts reads persona prompt files (empty path → built-in default).
 // A named-but-unreadable file is an error: the operator asked for a prompt
 // we cannot deliver.
@@ -52,12 +68,12 @@ func LoadPrompts(divPath, convPath, refPath string) (Prompts, error) {
 		if path == "" {
 			return nil
 		}
-		data, err := os.ReadFile(path)
+		text, err := readPrompt(path)
 		if err != nil {
 			return fmt.Errorf("twobrain prompt %s: %w", path, err)
 		}
-		if s := strings.TrimSpace(string(data)); s != "" {
-			*dst = s
+		if text != "" {
+			*dst = text
 		}
 		return nil
 	}
@@ -73,6 +89,25 @@ func LoadPrompts(divPath, convPath, refPath string) (Prompts, error) {
 	return p, nil
 }
 
+func readPrompt(path string) (string, error) {
+	info, err := os.Stat(path)
+	if err != nil {
+		return "", err
+	}
+	promptMu.Lock()
+	defer promptMu.Unlock()
+	if e, ok := promptCache[path]; ok && e.size == info.Size() && e.modTime.Equal(info.ModTime()) {
+		return e.text, nil
+	}
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return "", err
+	}
+	text := strings.TrimSpace(string(data))
+	promptCache[path] = promptEntry{size: info.Size(), modTime: info.ModTime(), text: text}
+	return text, nil
+}
+
 type Stage struct {
 	Divergent    provider.Provider // right brain
 	Convergent   provider.Provider // left brain (often same base model)
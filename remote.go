@@ -132,6 +132,14 @@ type askConsensus struct {
 // a non-zero exit per spec 09.
 var errBudgetNoAnswer = errors.New("budget exhausted before any answer was produced")
 
+// SSE framing bytes, hoisted so the wait loop compares against them without
+// allocating per line.
+var (
+	sseEventPrefix = []byte("event: ")
+	sseDataPrefix  = []byte("data: ")
+	sseDoneEvent   = []byte("done")
+)
+
 // wait consumes the task's SSE stream (replay-then-tail) until it
 // terminates, writing a terse per-stage progress log to progress (stderr)
 // and returning the collected result.
@@ -154,21 +162,21 @@ func (c *remoteClient) wait(taskID string, progress io.Writer) (*askResult, erro
 
 	sc := bufio.NewScanner(resp.Body)
 	sc.Buffer(make([]byte, 0, 64*1024), 4*1024*1024)
-	current := ""
 	for sc.Scan() {
-		line := sc.Text()
-		if strings.HasPrefix(line, "event: ") {
-			current = strings.TrimPrefix(line, "event: ")
-			if current == "done" {
+		// Work on the scanner's byte slice directly — every data line would
+		// otherwise be materialized as a string just to strip its prefix.
+		line := sc.Bytes()
+		if bytes.HasPrefix(line, sseEventPrefix) {
+			if bytes.Equal(line[len(sseEventPrefix):], sseDoneEvent) {
 				break
 			}
 			continue
 		}
-		if !strings.HasPrefix(line, "data: ") || current == "done" {
+		if !bytes.HasPrefix(line, sseDataPrefix) {
 			continue
 		}
 		var ev events.Event
-		if err := json.Unmarshal([]byte(strings.TrimPrefix(line, "data: ")), &ev); err != nil {
+		if err := json.Unmarshal(line[len(sseDataPrefix):], &ev); err != nil {
 			continue
 		}
 		c.progressLine(progress, ev)